@@ -1,39 +1,130 @@
 """OpenRouter API client."""
 import asyncio
+import hashlib
+import os
+import random
+import time
+import uuid
+from pathlib import Path
 from typing import Optional
 
 import aiohttp
+import orjson
 from tqdm import tqdm
 
 from core.constants import (
     API_TIMEOUT,
     DEFAULT_SYSTEM_PROMPT,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_MULTI_TOKENS,
     MAX_RETRIES,
+    MAX_TOKENS,
+    MULTI_ANSWER_PATTERN,
+    MULTI_PROMPT_INSTRUCTIONS,
     OPENROUTER_API_URL,
+    REQUESTS_PER_MINUTE,
     RETRY_DELAY,
+    RETRY_MAX_DELAY,
 )
-from core.exceptions import APIConnectionError, APIResponseError
+from core.exceptions import (
+    APIConnectionError,
+    APIError,
+    APIResponseError,
+    APIResponseTruncatedError,
+)
+from core.models import Prompt
+
+
+class _TokenBucket:
+    """Async token bucket refilled at rpm/60 tokens per second (rpm <= 0 disables)."""
+
+    def __init__(self, rpm: int):
+        self.rate = rpm / 60
+        self.capacity = max(1.0, self.rate)  # Allow at most ~1s worth of burst
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        if self.rate <= 0:
+            return
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
 
 
 class OpenRouterClient:
     """OpenRouter API client (async, with retry support)."""
 
-    def __init__(self, api_key: str, model: str, site_url: str = "https://example.com"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        site_url: str = "https://example.com",
+        cache_dir: Optional[Path] = None,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        rpm: int = REQUESTS_PER_MINUTE
+    ):
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
         self.api_key = api_key
         self.model = model
         self.site_url = site_url
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         self._session: Optional[aiohttp.ClientSession] = None
+        # Bounds in-flight requests and smooths bursts across all generate() calls
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._bucket = _TokenBucket(rpm)
+        self._session_lock = asyncio.Lock()
 
     async def __aenter__(self) -> "OpenRouterClient":
-        self._session = aiohttp.ClientSession()
+        self._session = self._create_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         if self._session:
             await self._session.close()
+            self._session = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Pooled session shared by every request of this client (keep-alive + DNS cache)."""
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
+            headers=self._headers
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the open session, recreating it if it was closed mid-run."""
+        if self._session is None:
+            raise RuntimeError("Client must be used with context manager")
+        if self._session.closed:
+            # Only one task recreates; the others reuse the new session
+            async with self._session_lock:
+                if self._session.closed:
+                    self._session = self._create_session()
+        return self._session
 
     @property
     def _headers(self) -> dict:
+        """Static request headers (set once as session defaults)."""
         return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -41,43 +132,113 @@ class OpenRouterClient:
             "X-Title": "Content Generator"
         }
 
+    def _cache_path(
+        self, system_prompt: str, prompt: str, max_tokens: int = MAX_TOKENS
+    ) -> Optional[Path]:
+        """Response cache file for (model, system_prompt, prompt), if caching is enabled."""
+        if self.cache_dir is None:
+            return None
+        key_source = f"{self.model}\x00{system_prompt}\x00{prompt}"
+        if max_tokens != MAX_TOKENS:
+            # Non-default budgets get their own entries (default keys stay unchanged)
+            key_source += f"\x00{max_tokens}"
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / key[:2] / key[2:]
+
+    @staticmethod
+    def _read_cache(path: Path) -> Optional[str]:
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_cache(path: Path, content: str) -> None:
+        # Best effort: a failed cache write must not fail the generation
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_text(content, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
     async def generate(
         self,
-        prompt: str,
+        prompt: str | Prompt,
         system_prompt: Optional[str] = None,
-        pbar: Optional[tqdm] = None
+        pbar: Optional[tqdm] = None,
+        max_tokens: int = MAX_TOKENS,
+        allow_truncated: bool = True,
+        attempts: int = MAX_RETRIES
     ) -> str:
-        """Generate content for a single prompt (with retry)."""
+        """Generate content for a single prompt (with retry).
+
+        With allow_truncated=False, a response cut off at max_tokens raises
+        APIResponseTruncatedError and is not cached.
+        """
         if not self._session:
             raise RuntimeError("Client must be used with context manager")
 
         if system_prompt is None:
             system_prompt = DEFAULT_SYSTEM_PROMPT
 
+        prompt_text = prompt if isinstance(prompt, str) else prompt.text
+        cache_path = self._cache_path(system_prompt, prompt_text, max_tokens)
+        if cache_path is not None:
+            cached = await asyncio.to_thread(self._read_cache, cache_path)
+            if cached is not None:
+                if pbar:
+                    pbar.update(1)
+                return cached
+
         payload = {
             "model": self.model,
             "messages": [
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
+                {"role": "user", "content": prompt_text}
             ],
             "temperature": 0.7,
-            "max_tokens": 4000
+            "max_tokens": max_tokens
         }
+        # Serialized once; Content-Type is set in the session headers
+        body = orjson.dumps(payload)
 
         last_error: Optional[Exception] = None
-        for attempt in range(MAX_RETRIES):
+        for attempt in range(attempts):
+            session = await self._get_session()
             try:
-                async with self._session.post(
+                async with self._sem, self._bucket, session.post(
                     OPENROUTER_API_URL,
-                    headers=self._headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)
+                    data=body
                 ) as response:
+                    # Client errors (except rate limiting) won't succeed on retry
+                    if 400 <= response.status < 500 and response.status != 429:
+                        raise APIResponseError(
+                            f"API request rejected ({response.status}): {await response.text()}"
+                        )
                     response.raise_for_status()
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
+                    choice = result["choices"][0]
+                    content = choice["message"]["content"]
+                    finish_reason = choice.get("finish_reason")
+                    if not allow_truncated and finish_reason == "length":
+                        raise APIResponseTruncatedError(
+                            f"Response hit the max_tokens limit ({max_tokens})"
+                        )
+                    # Only complete, non-empty replies are worth replaying on later runs
+                    if (
+                        cache_path is not None
+                        and finish_reason == "stop"
+                        and content
+                        and not content.isspace()
+                    ):
+                        await asyncio.to_thread(self._write_cache, cache_path, content)
                     if pbar:
                         pbar.update(1)
-                    return result["choices"][0]["message"]["content"]
+                    return content
+            except APIResponseError:
+                raise
             except aiohttp.ClientError as e:
                 last_error = APIConnectionError(f"Connection error: {e}")
             except KeyError as e:
@@ -85,33 +246,92 @@ class OpenRouterClient:
             except Exception as e:
                 last_error = e
 
-            if attempt < MAX_RETRIES - 1:
-                await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+            if attempt < attempts - 1:
+                # Capped exponential backoff with full jitter
+                await asyncio.sleep(
+                    random.uniform(0, min(RETRY_MAX_DELAY, RETRY_DELAY * (2 ** attempt)))
+                )
 
         raise APIConnectionError(
-            f"API call failed after {MAX_RETRIES} attempts: {last_error}"
+            f"API call failed after {attempts} attempts: {last_error}"
         )
 
     async def generate_batch(
         self,
-        tasks: list[tuple[str, str]],
+        tasks: list[tuple[str, str | Prompt]],
         pbar: Optional[tqdm] = None
     ) -> dict[str, str]:
-        """Process multiple prompts in parallel."""
-        async def _task(name: str, prompt: str) -> tuple[str, str]:
-            result = await self.generate(prompt, pbar=pbar)
-            return name, result
-
-        results = await asyncio.gather(
-            *[_task(name, prompt) for name, prompt in tasks],
-            return_exceptions=True
+        """Process multiple prompts in parallel (bounded by max_concurrent)."""
+        # TaskGroup cancels the remaining calls as soon as one fails
+        try:
+            async with asyncio.TaskGroup() as tg:
+                running = {
+                    name: tg.create_task(self.generate(prompt, pbar=pbar))
+                    for name, prompt in tasks
+                }
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+
+        return {name: task.result() for name, task in running.items()}
+
+    @staticmethod
+    def _combine_prompts(prompts: list[str | Prompt]) -> str | Prompt:
+        """Pack several prompts into one numbered multi-task prompt."""
+        # Keep a shared static prefix in front of the per-task bodies
+        shared_static: Optional[str] = None
+        if all(isinstance(p, Prompt) for p in prompts) and len({p.static for p in prompts}) == 1:
+            shared_static = prompts[0].static
+
+        bodies = [
+            p.dynamic if shared_static is not None else (p if isinstance(p, str) else p.text)
+            for p in prompts
+        ]
+        combined = MULTI_PROMPT_INSTRUCTIONS.format(count=len(prompts)) + "".join(
+            f"\n\n=== TASK {i} ===\n{body}" for i, body in enumerate(bodies, 1)
         )
 
-        output = {}
-        for item in results:
-            if isinstance(item, Exception):
-                raise item
-            name, content = item
-            output[name] = content
+        if shared_static is not None:
+            return Prompt(shared_static, combined)
+        return combined
 
-        return output
+    @staticmethod
+    def _split_answers(raw: str, count: int) -> Optional[list[str]]:
+        """Split a multi-task response; None if it doesn't contain exactly count answers."""
+        parts = MULTI_ANSWER_PATTERN.split(raw)
+        # parts = [preamble, "1", answer_1, "2", answer_2, ...]
+        if parts[1::2] != [str(i) for i in range(1, count + 1)]:
+            return None
+        answers = [answer.strip() for answer in parts[2::2]]
+        return answers if all(answers) else None
+
+    async def generate_multi(
+        self,
+        prompts: list[str | Prompt],
+        pbar: Optional[tqdm] = None
+    ) -> list[str]:
+        """Generate several prompts with a single API call (ordered results).
+
+        Falls back to parallel single calls if the combined request fails (rejected,
+        timed out, cut off at the token limit) or its response can't be split.
+        """
+        if len(prompts) > 1:
+            try:
+                # One attempt only: the single-call fallback does its own retrying
+                raw = await self.generate(
+                    self._combine_prompts(prompts),
+                    max_tokens=min(MAX_TOKENS * len(prompts), MAX_MULTI_TOKENS),
+                    allow_truncated=False,
+                    attempts=1
+                )
+            except APIError:
+                raw = None
+            answers = self._split_answers(raw, len(prompts)) if raw is not None else None
+            if answers is not None:
+                if pbar:
+                    pbar.update(len(prompts))
+                return answers
+
+        results = await self.generate_batch(
+            [(str(i), prompt) for i, prompt in enumerate(prompts)], pbar=pbar
+        )
+        return [results[str(i)] for i in range(len(prompts))]
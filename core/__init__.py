@@ -3,22 +3,33 @@ from core.config import load_api_key, load_config, save_default_config, validate
 from core.constants import (
     API_TIMEOUT,
     AVAILABLE_MODELS,
+    DEFAULT_CACHE_DIR,
     DEFAULT_CONFIG_PATH,
     DEFAULT_MODEL,
     DEFAULT_OUTPUT_DIR,
     DEFAULT_SYSTEM_PROMPT,
+    LAST_SENTENCE_END_PATTERN,
     MARKDOWN_FENCE_PATTERN,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_MULTI_TOKENS,
     MAX_RETRIES,
+    MAX_TOKENS,
+    MULTI_ANSWER_PATTERN,
+    MULTI_PROMPT_INSTRUCTIONS,
     OPENROUTER_API_URL,
+    REQUESTS_PER_MINUTE,
     REQUIRED_CONFIG_FIELDS,
     RETRY_DELAY,
+    RETRY_MAX_DELAY,
     UPPERCASE_WORD_PATTERN,
+    WORD_PATTERN,
 )
 from core.exceptions import (
     APIConnectionError,
     APIError,
     APIKeyError,
     APIResponseError,
+    APIResponseTruncatedError,
     ConfigError,
     ConfigNotFoundError,
     ConfigValidationError,
@@ -29,7 +40,9 @@ from core.models import (
     ContentConfig,
     GeneratedContent,
     PlaceholderConfig,
+    Prompt,
     Section,
+    SectionPromptContext,
     SEOConfig,
     SiteConfig,
     TableColumn,
@@ -46,21 +59,32 @@ __all__ = [
     # Constants
     "API_TIMEOUT",
     "AVAILABLE_MODELS",
+    "DEFAULT_CACHE_DIR",
     "DEFAULT_CONFIG_PATH",
     "DEFAULT_MODEL",
     "DEFAULT_OUTPUT_DIR",
     "DEFAULT_SYSTEM_PROMPT",
+    "LAST_SENTENCE_END_PATTERN",
     "MARKDOWN_FENCE_PATTERN",
+    "MAX_CONCURRENT_REQUESTS",
+    "MAX_MULTI_TOKENS",
     "MAX_RETRIES",
+    "MAX_TOKENS",
+    "MULTI_ANSWER_PATTERN",
+    "MULTI_PROMPT_INSTRUCTIONS",
     "OPENROUTER_API_URL",
+    "REQUESTS_PER_MINUTE",
     "REQUIRED_CONFIG_FIELDS",
     "RETRY_DELAY",
+    "RETRY_MAX_DELAY",
     "UPPERCASE_WORD_PATTERN",
+    "WORD_PATTERN",
     # Exceptions
     "APIConnectionError",
     "APIError",
     "APIKeyError",
     "APIResponseError",
+    "APIResponseTruncatedError",
     "ConfigError",
     "ConfigNotFoundError",
     "ConfigValidationError",
@@ -70,7 +94,9 @@ __all__ = [
     "ContentConfig",
     "GeneratedContent",
     "PlaceholderConfig",
+    "Prompt",
     "Section",
+    "SectionPromptContext",
     "SEOConfig",
     "SiteConfig",
     "TableColumn",
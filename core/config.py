@@ -5,6 +5,14 @@ from pathlib import Path
 import yaml
 from dotenv import load_dotenv
 
+# Prefer libyaml-backed C loader/dumper when available
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
 from core.constants import (
     DEFAULT_CONFIG_PATH,
     DEFAULT_MODEL,
@@ -68,7 +76,7 @@ def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> ContentConfig:
         raise ConfigNotFoundError(f"Config file not found: {config_path}")
 
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
 
     validate_config(data)
 
@@ -185,5 +193,8 @@ def save_default_config(config_path: str = DEFAULT_CONFIG_PATH) -> None:
         }
     }
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(default_config, f, allow_unicode=True, default_flow_style=False)
+        yaml.dump(
+            default_config, f, Dumper=_SafeDumper,
+            allow_unicode=True, default_flow_style=False
+        )
     print(f"   ✓ Example config created: {config_path}")
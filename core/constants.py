@@ -1,5 +1,6 @@
 """Constants and compiled regex patterns."""
 import re
+from functools import lru_cache
 
 # API Endpoints
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -7,13 +8,23 @@ OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 # Defaults
 DEFAULT_CONFIG_PATH = "config.yaml"
 DEFAULT_OUTPUT_DIR = "content"
+DEFAULT_CACHE_DIR = "~/.cache/contentforge"
 DEFAULT_MODEL = "openai/gpt-4o-mini"
 
 # Retry settings
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds (base for exponential backoff)
+RETRY_MAX_DELAY = 30  # seconds (backoff cap)
 API_TIMEOUT = 120  # seconds
 
+# Completion budget per prompt (a combined multi-task request gets one per task)
+MAX_TOKENS = 4000
+MAX_MULTI_TOKENS = 16000  # cap for combined requests (common model completion limit)
+
+# Concurrency settings
+MAX_CONCURRENT_REQUESTS = 8
+REQUESTS_PER_MINUTE = 500  # client-side throttle (0 disables)
+
 # Available models
 AVAILABLE_MODELS = {
     "1": ("openai/gpt-4o", "GPT-4o (higher quality, slower)"),
@@ -24,6 +35,9 @@ AVAILABLE_MODELS = {
 # Compiled regex patterns (for performance)
 MARKDOWN_FENCE_PATTERN = re.compile(r'```\w*\s*')
 UPPERCASE_WORD_PATTERN = re.compile(r'\b([A-Z]{3,})\b')
+WORD_PATTERN = re.compile(r'\S+')
+# Greedy prefix ending at the last '.', '!' or '?' (backtracks once, in C)
+LAST_SENTENCE_END_PATTERN = re.compile(r'.*[.!?]', re.DOTALL)
 
 # Default system prompt
 DEFAULT_SYSTEM_PROMPT = """You are an experienced SEO content writer. You create content that meets Google E-E-A-T standards and provides value to readers.
@@ -40,6 +54,12 @@ FORMAT RULES:
 - Do not add explanations, comments, or meta information
 - Do not use HTML tags (unless specified otherwise)"""
 
+# Multi-prompt requests (several tasks answered in one API call)
+MULTI_PROMPT_INSTRUCTIONS = """Complete each of the {count} TASKS below independently.
+Begin each answer with a line containing only "=== ANSWER <task number> ===".
+Write nothing before the first answer marker and add no other commentary."""
+MULTI_ANSWER_PATTERN = re.compile(r'^=== ANSWER (\d+) ===[ \t]*$', re.MULTILINE)
+
 # Required config fields
 REQUIRED_CONFIG_FIELDS = ["title", "intro_words", "conclusion_words", "sections"]
 
@@ -72,3 +92,12 @@ def get_translation(language: str, key: str) -> str:
     """Get translation for a key in the specified language."""
     lang_dict = TRANSLATIONS.get(language, TRANSLATIONS["English"])
     return lang_dict.get(key, TRANSLATIONS["English"][key])
+
+
+@lru_cache(maxsize=32)
+def compile_keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern | None:
+    """Compile keywords into one case-insensitive alternation (longest match first)."""
+    if not keywords:
+        return None
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(k) for k in ordered), re.IGNORECASE)
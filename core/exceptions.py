@@ -41,6 +41,11 @@ class APIResponseError(APIError):
     pass
 
 
+class APIResponseTruncatedError(APIResponseError):
+    """API response cut off at the max_tokens limit."""
+    pass
+
+
 class ContentGenerationError(SEOGeneratorError):
     """Content generation error."""
     pass
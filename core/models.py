@@ -1,5 +1,6 @@
 """Data models - Dataclass definitions."""
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 @dataclass
@@ -25,6 +26,11 @@ class TableConfig:
     rows: int = 0
     columns: list[TableColumn] = field(default_factory=list)
 
+    @cached_property
+    def column_names(self) -> str:
+        """Pipe-joined column names (for table prompts)."""
+        return " | ".join(col.name for col in self.columns)
+
     def get_default_columns(self) -> list[TableColumn]:
         """Return default columns."""
         return [
@@ -71,7 +77,7 @@ class SEOConfig:
 
 @dataclass
 class ContentConfig:
-    """Main content configuration."""
+    """Main content configuration (treated as immutable after load_config)."""
     title: str
     intro_words: int
     conclusion_words: int
@@ -85,12 +91,12 @@ class ContentConfig:
     output: str = "html"  # Output format: "html" or "md"
     language: str = "English"  # Content language
 
-    @property
+    @cached_property
     def headings(self) -> list[str]:
         """Return section headings."""
         return [s.heading for s in self.sections]
 
-    @property
+    @cached_property
     def total_words(self) -> int:
         """Total target word count."""
         return (
@@ -99,7 +105,7 @@ class ContentConfig:
             + sum(s.words for s in self.sections)
         )
 
-    @property
+    @cached_property
     def api_call_count(self) -> int:
         """Total API call count."""
         base = 2 + len(self.sections)
@@ -108,14 +114,42 @@ class ContentConfig:
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRow:
-    """Dynamic table row data."""
-    values: dict[str, str] = field(default_factory=dict)
+    """Dynamic table row data (values aligned with column order)."""
+    values: tuple[str, ...] = ()
+    index: dict[str, int] = field(default_factory=dict)  # column name -> position (shared per table)
 
     def get(self, column_name: str, default: str = "") -> str:
         """Get column value."""
-        return self.values.get(column_name, default)
+        i = self.index.get(column_name)
+        if i is None or i >= len(self.values):
+            return default
+        return self.values[i]
+
+
+@dataclass(slots=True, frozen=True)
+class SectionPromptContext:
+    """Per-article section prompt fragments (built once, shared by all sections)."""
+    title: str
+    total_sections: int
+    tone_desc: str
+    placeholder_hint: str
+    keyword_line: str  # Primary keyword instruction ("" if none)
+    secondary_keywords: tuple[tuple[str, str], ...]  # (original, lowercased) pairs
+    language_line: str
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """Prompt split into a static (call-independent) prefix and a dynamic suffix."""
+    static: str
+    dynamic: str
+
+    @property
+    def text(self) -> str:
+        """Full prompt text, static prefix first."""
+        return f"{self.static}\n\n{self.dynamic}"
 
 
 @dataclass
@@ -4,6 +4,7 @@ from generators.markdown import build_full_md, build_table_md, text_to_md
 from generators.prompts import (
     build_conclusion_prompt,
     build_intro_prompt,
+    build_section_context,
     build_section_prompt,
     build_table_prompt,
 )
@@ -17,6 +18,7 @@ __all__ = [
     "text_to_md",
     "build_conclusion_prompt",
     "build_intro_prompt",
+    "build_section_context",
     "build_section_prompt",
     "build_table_prompt",
 ]
@@ -1,13 +1,39 @@
 """HTML generation functions."""
-import re
+import io
+from functools import lru_cache
+from itertools import groupby
+
+from core.constants import compile_keyword_pattern
 from core.models import GeneratedContent, TableColumn, TableRow
 
+# Static page scaffolding (only titles, headings and content are dynamic)
+_INTRO_OPEN = '<div class="intro">\n'
+_INTRO_CLOSE = '\n</div>\n\n'
+_TABLE_OPEN = '<div class="comparison-table">\n'
+_TABLE_CLOSE = '\n</div>\n\n'
+_SECTION_OPEN = '<section>\n'
+_SECTION_CLOSE = '\n</section>\n\n'
+_CONCLUSION_OPEN = '<div class="conclusion">\n'
+_CONCLUSION_CLOSE = '\n</div>'
+
+# Star strings indexed by clamped rating (1-5)
+_STARS = ("", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+
+# Common rating values ("1"-"5") resolved without int() parsing
+_STAR_CACHE: dict[str, str] = {str(n): _STARS[n] for n in range(1, 6)}
+
+# Bullet prefixes recognised as list items
+_LIST_MARKERS = ('• ', '- ', '* ')
+
 
 def value_to_stars(value: str) -> str:
     """Convert rating value to stars."""
+    cached = _STAR_CACHE.get(value)
+    if cached is not None:
+        return cached
     try:
         num = int(value.strip())
-        return "⭐" * min(max(num, 1), 5)
+        return _STARS[min(max(num, 1), 5)]
     except ValueError:
         return value
 
@@ -17,60 +43,81 @@ def build_table_html(rows: list[TableRow], columns: list[TableColumn]) -> str:
     if not rows or not columns:
         return ""
 
-    lines = [
-        '<table class="table table-striped">',
-        '  <thead>',
-        '    <tr>',
-    ]
-
-    # Dynamic headers
-    for col in columns:
-        lines.append(f'      <th>{col.header}</th>')
+    # Column metadata (computed once, not per row)
+    header_row = ''.join(f'      <th>{col.header}</th>\n' for col in columns)
+    star_flags = [col.type == "stars" for col in columns]
 
-    lines.extend([
-        '    </tr>',
-        '  </thead>',
-        '  <tbody>'
-    ])
+    buf = io.StringIO()
+    write = buf.write
+    write('<table class="table table-striped">\n  <thead>\n    <tr>\n')
+    write(header_row)
+    write('    </tr>\n  </thead>\n  <tbody>\n')
 
     # Rows
     for row in rows:
-        lines.append('    <tr>')
-        for col in columns:
-            value = row.get(col.name, "")
+        write('    <tr>\n')
+        for value, is_stars in zip(row.values, star_flags):
             # Convert to stars if column type is stars
-            if col.type == "stars":
+            if is_stars:
                 value = value_to_stars(value)
-            lines.append(f'      <td>{value}</td>')
-        lines.append('    </tr>')
+            write(f'      <td>{value}</td>\n')
+        write('    </tr>\n')
+
+    write('  </tbody>\n</table>')
+    return buf.getvalue()
+
 
-    lines.extend([
-        '  </tbody>',
-        '</table>'
-    ])
+@lru_cache(maxsize=32)
+def _lowered_keywords(keywords: tuple[str, ...]) -> tuple[str, ...] | None:
+    """Lower-cased keyword forms for the cheap membership prefilter.
 
-    return '\n'.join(lines)
+    None unless every keyword is ASCII: only then does str.lower() agree with
+    re.IGNORECASE (e.g. "İ", "ς" and the Kelvin sign fold differently).
+    """
+    if not all(k.isascii() for k in keywords):
+        return None
+    return tuple(k.lower() for k in keywords)
 
 
 def highlight_keywords(text: str, keywords: list[str]) -> str:
     """Highlight only specified keywords."""
     if not keywords:
         return text
+    keywords = tuple(keywords)
 
-    for keyword in keywords:
-        # Case-insensitive search, preserve original case
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        text = pattern.sub(lambda m: f'<b>{m.group()}</b>', text)
+    # Skip the regex pass when no keyword occurs at all (ASCII-only, see above)
+    lowered = _lowered_keywords(keywords)
+    if lowered is not None and text.isascii():
+        text_lower = text.lower()
+        if not any(k in text_lower for k in lowered):
+            return text
 
-    return text
+    # Case-insensitive search, preserve original case
+    return compile_keyword_pattern(keywords).sub(lambda m: f'<b>{m.group(0)}</b>', text)
 
 
 def text_to_html(text: str, keywords: list[str] | None = None) -> str:
     """Convert plain text to HTML paragraphs."""
-    text = text.strip()
-    if not text:
+    return _text_to_html_cached(text, tuple(keywords) if keywords else ())
+
+
+@lru_cache(maxsize=256)
+def _text_to_html_cached(text: str, keywords: tuple[str, ...]) -> str:
+    """Memoized conversion keyed by (text, keywords)."""
+    # Lines are stripped individually below; no need to copy the whole text
+    if not text or text.isspace():
         return ""
 
+    # Fast path: no list markers anywhere, so only paragraphs are possible
+    if not any(marker in text for marker in _LIST_MARKERS):
+        lines = (line.strip() for line in text.splitlines())
+        html = "\n".join(
+            f"<p>{' '.join(group)}</p>" for has_text, group in groupby(lines, key=bool) if has_text
+        )
+        if keywords:
+            html = highlight_keywords(html, keywords)
+        return html
+
     paragraphs = []
     current_list: list[str] = []
     current_para: list[str] = []
@@ -86,14 +133,14 @@ def text_to_html(text: str, keywords: list[str] | None = None) -> str:
             paragraphs.append(f"<ul>\n{items}\n</ul>")
             current_list.clear()
 
-    for line in text.split('\n'):
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             flush_para()
             flush_list()
             continue
 
-        if line.startswith(('• ', '- ', '* ')):
+        if line.startswith(_LIST_MARKERS):
             flush_para()
             current_list.append(line[2:])
         else:
@@ -121,38 +168,30 @@ def build_full_html(
     conclusion_header: str = "Conclusion"
 ) -> str:
     """Combine all content into HTML format."""
-    lines = [
-        f"<h1>{title}</h1>",
-        "",
-        '<div class="intro">',
-        text_to_html(content.intro, keywords),
-        '</div>',
-        ""
-    ]
-
-    if content.table_html and content.table_html.strip():
-        lines.extend([
-            '<div class="comparison-table">',
-            f'<h2>{table_header}</h2>',
-            content.table_html.strip(),
-            '</div>',
-            ""
-        ])
+    buf = io.StringIO()
+    write = buf.write
+
+    write(f'<h1>{title}</h1>\n\n')
+    write(_INTRO_OPEN)
+    write(text_to_html(content.intro, keywords))
+    write(_INTRO_CLOSE)
+
+    table = content.table_html.strip()
+    if table:
+        write(_TABLE_OPEN)
+        write(f'<h2>{table_header}</h2>\n')
+        write(table)
+        write(_TABLE_CLOSE)
 
     for heading, section_content in zip(headings, content.sections):
-        lines.extend([
-            '<section>',
-            f'<h2>{heading}</h2>',
-            text_to_html(section_content, keywords),
-            '</section>',
-            ""
-        ])
-
-    lines.extend([
-        '<div class="conclusion">',
-        f'<h2>{conclusion_header}</h2>',
-        text_to_html(content.conclusion, keywords),
-        '</div>'
-    ])
-
-    return '\n'.join(lines)
+        write(_SECTION_OPEN)
+        write(f'<h2>{heading}</h2>\n')
+        write(text_to_html(section_content, keywords))
+        write(_SECTION_CLOSE)
+
+    write(_CONCLUSION_OPEN)
+    write(f'<h2>{conclusion_header}</h2>\n')
+    write(text_to_html(content.conclusion, keywords))
+    write(_CONCLUSION_CLOSE)
+
+    return buf.getvalue()
@@ -1,13 +1,33 @@
 """Markdown generation functions."""
-import re
+import io
+from functools import lru_cache
+from itertools import chain, groupby
+
+from core.constants import compile_keyword_pattern
 from core.models import GeneratedContent, TableColumn, TableRow
 
+# Static document scaffolding
+_H2 = "## "
+_BLOCK_SEP = "\n\n"
+
+# Star strings indexed by clamped rating (1-5)
+_STARS = ("", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+
+# Common rating values ("1"-"5") resolved without int() parsing
+_STAR_CACHE: dict[str, str] = {str(n): _STARS[n] for n in range(1, 6)}
+
+# Bullet prefixes recognised as list items
+_LIST_MARKERS = ('• ', '- ', '* ')
+
 
 def value_to_stars(value: str) -> str:
     """Convert rating value to stars."""
+    cached = _STAR_CACHE.get(value)
+    if cached is not None:
+        return cached
     try:
         num = int(value.strip())
-        return "⭐" * min(max(num, 1), 5)
+        return _STARS[min(max(num, 1), 5)]
     except ValueError:
         return value
 
@@ -17,47 +37,72 @@ def build_table_md(rows: list[TableRow], columns: list[TableColumn]) -> str:
     if not rows or not columns:
         return ""
 
-    lines = []
+    # Column metadata (computed once, not per row)
+    star_flags = [col.type == "stars" for col in columns]
+
+    def _cells(row: TableRow):
+        for value, is_stars in zip(row.values, star_flags):
+            yield value_to_stars(value) if is_stars else value
+
+    # Header row, separator row, data rows
+    header = "| " + " | ".join(col.header for col in columns) + " |"
+    separator = "| " + " | ".join(["---"] * len(columns)) + " |"
+    data_rows = ("| " + " | ".join(_cells(row)) + " |" for row in rows)
 
-    # Header row
-    headers = [col.header for col in columns]
-    lines.append("| " + " | ".join(headers) + " |")
+    return "\n".join(chain((header, separator), data_rows))
 
-    # Separator row
-    lines.append("| " + " | ".join(["---"] * len(columns)) + " |")
 
-    # Data rows
-    for row in rows:
-        values = []
-        for col in columns:
-            value = row.get(col.name, "")
-            if col.type == "stars":
-                value = value_to_stars(value)
-            values.append(value)
-        lines.append("| " + " | ".join(values) + " |")
+@lru_cache(maxsize=32)
+def _lowered_keywords(keywords: tuple[str, ...]) -> tuple[str, ...] | None:
+    """Lower-cased keyword forms for the cheap membership prefilter.
 
-    return "\n".join(lines)
+    None unless every keyword is ASCII: only then does str.lower() agree with
+    re.IGNORECASE (e.g. "İ", "ς" and the Kelvin sign fold differently).
+    """
+    if not all(k.isascii() for k in keywords):
+        return None
+    return tuple(k.lower() for k in keywords)
 
 
 def highlight_keywords_md(text: str, keywords: list[str]) -> str:
     """Highlight keywords with bold markdown (**keyword**)."""
     if not keywords:
         return text
+    keywords = tuple(keywords)
 
-    for keyword in keywords:
-        # Case-insensitive search, preserve original case
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        text = pattern.sub(lambda m: f'**{m.group()}**', text)
+    # Skip the regex pass when no keyword occurs at all (ASCII-only, see above)
+    lowered = _lowered_keywords(keywords)
+    if lowered is not None and text.isascii():
+        text_lower = text.lower()
+        if not any(k in text_lower for k in lowered):
+            return text
 
-    return text
+    # Case-insensitive search, preserve original case
+    return compile_keyword_pattern(keywords).sub(lambda m: f'**{m.group(0)}**', text)
 
 
 def text_to_md(text: str, keywords: list[str] | None = None) -> str:
     """Convert plain text to Markdown paragraphs."""
-    text = text.strip()
-    if not text:
+    return _text_to_md_cached(text, tuple(keywords) if keywords else ())
+
+
+@lru_cache(maxsize=256)
+def _text_to_md_cached(text: str, keywords: tuple[str, ...]) -> str:
+    """Memoized conversion keyed by (text, keywords)."""
+    # Lines are stripped individually below; no need to copy the whole text
+    if not text or text.isspace():
         return ""
 
+    # Fast path: no list markers anywhere, so only paragraphs are possible
+    if not any(marker in text for marker in _LIST_MARKERS):
+        lines = (line.strip() for line in text.splitlines())
+        md = "\n\n".join(
+            " ".join(group) for has_text, group in groupby(lines, key=bool) if has_text
+        )
+        if keywords:
+            md = highlight_keywords_md(md, keywords)
+        return md
+
     paragraphs = []
     current_list: list[str] = []
     current_para: list[str] = []
@@ -73,14 +118,14 @@ def text_to_md(text: str, keywords: list[str] | None = None) -> str:
             paragraphs.append(items)
             current_list.clear()
 
-    for line in text.split('\n'):
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             flush_para()
             flush_list()
             continue
 
-        if line.startswith(('• ', '- ', '* ')):
+        if line.startswith(_LIST_MARKERS):
             flush_para()
             current_list.append(line[2:])
         else:
@@ -108,33 +153,25 @@ def build_full_md(
     conclusion_header: str = "Conclusion"
 ) -> str:
     """Combine all content into Markdown format."""
-    lines = [
-        f"# {title}",
-        "",
-        text_to_md(content.intro, keywords),
-        ""
-    ]
-
-    if content.table_md and content.table_md.strip():
-        lines.extend([
-            f"## {table_header}",
-            "",
-            content.table_md.strip(),
-            ""
-        ])
+    buf = io.StringIO()
+    write = buf.write
+
+    write(f"# {title}{_BLOCK_SEP}")
+    write(text_to_md(content.intro, keywords))
+    write(_BLOCK_SEP)
+
+    table = content.table_md.strip()
+    if table:
+        write(f"{_H2}{table_header}{_BLOCK_SEP}")
+        write(table)
+        write(_BLOCK_SEP)
 
     for heading, section_content in zip(headings, content.sections):
-        lines.extend([
-            f"## {heading}",
-            "",
-            text_to_md(section_content, keywords),
-            ""
-        ])
-
-    lines.extend([
-        f"## {conclusion_header}",
-        "",
-        text_to_md(content.conclusion, keywords)
-    ])
-
-    return "\n".join(lines)
+        write(f"{_H2}{heading}{_BLOCK_SEP}")
+        write(text_to_md(section_content, keywords))
+        write(_BLOCK_SEP)
+
+    write(f"{_H2}{conclusion_header}{_BLOCK_SEP}")
+    write(text_to_md(content.conclusion, keywords))
+
+    return buf.getvalue()
@@ -1,26 +1,23 @@
 """SEO-focused prompt builder functions."""
-from core.models import PlaceholderConfig, SEOConfig, TableConfig
-
-
-def build_intro_prompt(
-    title: str,
-    headings: list[str],
-    intro_words: int,
-    seo: SEOConfig,
-    language: str = "English"
-) -> str:
-    """Build intro paragraph prompt - SEO optimized."""
-    topics = ', '.join(headings[:3])
-
-    keyword_instruction = ""
-    if seo.primary_keyword:
-        keyword_instruction = f"\n- Use the primary keyword ({seo.primary_keyword}) naturally in the first 2 sentences"
-
-    audience_instruction = ""
-    if seo.target_audience:
-        audience_instruction = f"\n- Target audience: {seo.target_audience}"
-
-    return f'''Write an INTRODUCTION paragraph for a blog post about "{title}".
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
+
+from core.models import (
+    PlaceholderConfig,
+    Prompt,
+    SectionPromptContext,
+    SEOConfig,
+    TableConfig,
+)
+
+# Static instruction blocks: identical across calls, always placed first.
+# Everything config-dependent goes into the dynamic suffix built by each function.
+# Note: these blocks (plus the system prompt) are well below the providers' minimum
+# cacheable prefix (~1024 tokens), so no provider prompt caching is requested.
+
+_INTRO_STATIC: Final[str] = '''Write an INTRODUCTION paragraph for the blog post described in ARTICLE DETAILS.
 
 HOOK STRATEGY (choose one):
 - Start with a surprising statistic or fact
@@ -28,18 +25,156 @@ HOOK STRATEGY (choose one):
 - Ask a curiosity-provoking question
 
 CONTENT REQUIREMENTS:
-- Approximately {intro_words} words
 - Explain what the article is about and what value it provides to the reader
-- Topics to be covered: {topics}{keyword_instruction}{audience_instruction}
+- Follow the word count, topics and keyword instructions in ARTICLE DETAILS
 
 AVOID:
 - Cliché openings like "In this article"
 - Filler phrases like "Nowadays", "In recent years"
 - Exaggerated promises
 
-IMPORTANT: Write plain text only. Do not use HTML tags.
+IMPORTANT: Write plain text only. Do not use HTML tags.'''
+
+_TABLE_STATIC: Final[str] = '''Provide comparison table data for the topic described in TABLE DETAILS.
+
+FORMAT: One item per line, separated by pipe (|), columns in the listed order.
+
+RULES:
+- Use numbers 1-5 for rating column
+- Write ONLY the requested number of data lines, nothing else'''
+
+_SECTION_STATIC: Final[str] = '''Write original content for one section of an article, as described in SECTION DETAILS.
+
+CONTENT REQUIREMENTS:
+- Write from the given PERSPECTIVE in the given TONE
+- At least 1 concrete example or numerical data
+- At least 2 practical, actionable tips
+- For bullet lists use: "• "
+
+AVOID:
+- DO NOT REPEAT MAIN TITLE: Don't use the main title within the section
+- Generic phrases: "quality service", "reliable platform", "professional team"
+- Exaggerated claims: "the best", "absolutely", "must", "guaranteed"
+- Filler sentences: "as everyone knows", "undoubtedly"
+
+IMPORTANT: Write plain text only. Do not use HTML tags.'''
+
+_CONCLUSION_STATIC: Final[str] = '''Write a CONCLUSION paragraph for the article described in ARTICLE DETAILS.
+
+CONTENT REQUIREMENTS:
+- Summarize main points in 1-2 sentences (synthesis, not repetition)
+- Suggest a concrete next step for the reader (CTA)
+- End with a positive but realistic tone
+
+AVOID:
+- Starting with "In conclusion"
+- Repeating exactly what was said in the article
+- Exaggerated promises
+
+IMPORTANT: Write plain text only. Do not use HTML tags.'''
+
+# Dynamic blocks, rendered with str.format_map
+_INTRO_TEMPLATE: Final[str] = '''ARTICLE DETAILS:
+- Title: "{title}"
+- Approximately {intro_words} words
+- Topics to be covered: {topics}{keyword_block}{audience_block}
+
+{language_line}'''
+
+_TABLE_TEMPLATE: Final[str] = '''TABLE DETAILS:
+- Topic: "{title}"
+- Rows: {row_count}
+- Columns: {column_names}{placeholder_block}
+
+EXAMPLE OUTPUT:
+{example_row}
+
+{language_line}'''
+
+_SECTION_TEMPLATE: Final[str] = '''SECTION DETAILS:
+- Heading: "{heading}"
+- Main title: {title}
+- Section: {section_number}/{total_sections}
+- PERSPECTIVE: {perspective}
+- TONE: {tone_desc}
+- Approximately {section_words} words{keyword_block}{secondary_block}
+- Use placeholders: {placeholder_hint}{avoid_block}
+
+{language_line}'''
+
+_CONCLUSION_TEMPLATE: Final[str] = '''ARTICLE DETAILS:
+- Title: "{title}"
+- Topics covered in the article: {topics}
+- Approximately {conclusion_words} words{keyword_block}
+
+{language_line}'''
+
+# Section lookups, indexed by section position / SEOConfig.tone
+_PERSPECTIVES: Final[tuple[str, ...]] = (
+    "Basic information and first steps for beginners",
+    "Practical comparison and evaluation criteria",
+    "Advanced tips and maximum benefit strategies",
+    "Common mistakes and how to avoid them",
+    "Future trends and things to watch out for",
+)
+_DEFAULT_PERSPECTIVE: Final[str] = "In-depth analysis and concrete examples"
+
+_TONE_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    "informative": "Informative and objective",
+    "conversational": "Friendly and conversational",
+    "professional": "Professional and formal",
+})
+_DEFAULT_TONE: Final[str] = "Informative"
+
 
-LANGUAGE: Write the content in {language}.'''
+@lru_cache(maxsize=16)
+def _language_line(language: str) -> str:
+    """Closing language instruction shared by all prompt types."""
+    return f"LANGUAGE: Write the content in {language}."
+
+
+def build_intro_prompt(
+    title: str,
+    headings: Sequence[str],
+    intro_words: int,
+    seo: SEOConfig,
+    language: str = "English"
+) -> Prompt:
+    """Build intro paragraph prompt - SEO optimized."""
+    return _build_intro_prompt(
+        title, tuple(headings), intro_words,
+        seo.primary_keyword, seo.target_audience, language
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_intro_prompt(
+    title: str,
+    headings: tuple[str, ...],
+    intro_words: int,
+    primary_keyword: str,
+    target_audience: str,
+    language: str
+) -> Prompt:
+    """Memoized intro prompt (pure function of hashable inputs)."""
+    topics = ', '.join(headings[:3])
+
+    keyword_block = ""
+    if primary_keyword:
+        keyword_block = f"\n- Use the primary keyword ({primary_keyword}) naturally in the first 2 sentences"
+
+    audience_block = ""
+    if target_audience:
+        audience_block = f"\n- Target audience: {target_audience}"
+
+    return Prompt(_INTRO_STATIC, _INTRO_TEMPLATE.format_map({
+        "title": title,
+        "intro_words": intro_words,
+        "topics": topics,
+        "keyword_block": keyword_block,
+        "audience_block": audience_block,
+        "language_line": _language_line(language),
+    }))
 
 
 def build_table_prompt(
@@ -47,155 +182,139 @@ def build_table_prompt(
     table_config: TableConfig,
     placeholders: PlaceholderConfig,
     language: str = "English"
-) -> str:
+) -> Prompt:
     """Build comparison table prompt - dynamic columns."""
     row_count = table_config.rows
     columns = table_config.columns
 
-    # Build column info
-    column_names = " | ".join(col.name for col in columns)
-
-    # Placeholder rules
+    # Placeholder rules and example row in one pass over the columns
     placeholder_rules = []
-    for i, col in enumerate(columns):
+    example_values = []
+    for col in columns:
         if col.placeholder:
             placeholder_rules.append(
                 f"- For {col.header} use [{col.placeholder}_1], [{col.placeholder}_2]... placeholders"
             )
-    placeholder_text = "\n".join(placeholder_rules) if placeholder_rules else ""
-
-    # Build example row
-    example_values = []
-    for col in columns:
-        if col.placeholder:
             example_values.append(f"[{col.placeholder}_1]")
         elif col.type == "stars":
             example_values.append("4")
         else:
             example_values.append("example")
+    placeholder_block = "\n" + "\n".join(placeholder_rules) if placeholder_rules else ""
     example_row = " | ".join(example_values)
 
-    return f'''Provide {row_count} item information for the topic "{title}".
-
-FORMAT: One item per line, separated by pipe (|).
-COLUMNS: {column_names}
-
-RULES:
-{placeholder_text}
-- Use numbers 1-5 for rating column
-
-EXAMPLE OUTPUT:
-{example_row}
-
-Write ONLY {row_count} lines of data, nothing else.
-
-LANGUAGE: Write the content in {language}.'''
+    return Prompt(_TABLE_STATIC, _TABLE_TEMPLATE.format_map({
+        "title": title,
+        "row_count": row_count,
+        "column_names": table_config.column_names,
+        "placeholder_block": placeholder_block,
+        "example_row": example_row,
+        "language_line": _language_line(language),
+    }))
 
 
-def _get_section_perspective(heading: str, section_index: int) -> str:
+def _get_section_perspective(section_index: int) -> str:
     """Determine unique perspective for each section."""
-    perspectives = {
-        0: "Basic information and first steps for beginners",
-        1: "Practical comparison and evaluation criteria",
-        2: "Advanced tips and maximum benefit strategies",
-        3: "Common mistakes and how to avoid them",
-        4: "Future trends and things to watch out for"
-    }
-    return perspectives.get(section_index, "In-depth analysis and concrete examples")
+    if 0 <= section_index < len(_PERSPECTIVES):
+        return _PERSPECTIVES[section_index]
+    return _DEFAULT_PERSPECTIVE
 
 
-def build_section_prompt(
+def build_section_context(
     title: str,
-    heading: str,
-    section_words: int,
-    section_index: int,
     total_sections: int,
-    previous_topics: list[str],
     seo: SEOConfig,
     placeholders: PlaceholderConfig,
     language: str = "English"
-) -> str:
-    """Build section content prompt - SEO optimized."""
-    perspective = _get_section_perspective(heading, section_index)
-
-    avoid_topics = ""
-    if previous_topics:
-        avoid_topics = f"\n- DO NOT REPEAT (already covered): {', '.join(previous_topics)}"
-
-    keyword_instruction = ""
+) -> SectionPromptContext:
+    """Build the section prompt fragments shared by every section of an article."""
+    keyword_line = ""
     if seo.primary_keyword:
-        keyword_instruction = f"\n- Primary keyword ({seo.primary_keyword}): Use naturally once in this section"
+        keyword_line = f"\n- Primary keyword ({seo.primary_keyword}): Use naturally once in this section"
 
-    secondary_instruction = ""
-    if seo.secondary_keywords:
-        relevant_kw = [kw for kw in seo.secondary_keywords if kw.lower() in heading.lower()]
-        if relevant_kw:
-            secondary_instruction = f"\n- Related keywords (use naturally): {', '.join(relevant_kw)}"
+    return SectionPromptContext(
+        title=title,
+        total_sections=total_sections,
+        tone_desc=_TONE_MAP.get(seo.tone, _DEFAULT_TONE),
+        placeholder_hint=f"[{placeholders.item_prefix}_NAME], [{placeholders.value_prefix}_VALUE]",
+        keyword_line=keyword_line,
+        secondary_keywords=tuple((kw, kw.lower()) for kw in seo.secondary_keywords),
+        language_line=_language_line(language)
+    )
 
-    tone_map = {
-        "informative": "Informative and objective",
-        "conversational": "Friendly and conversational",
-        "professional": "Professional and formal"
-    }
-    tone_desc = tone_map.get(seo.tone, "Informative")
 
-    # Placeholder usage
-    placeholder_hint = f"[{placeholders.item_prefix}_NAME], [{placeholders.value_prefix}_VALUE]"
-
-    return f'''Write original content about "{heading}".
-
-MAIN TITLE: {title}
-SECTION: {section_index + 1}/{total_sections}
-PERSPECTIVE: {perspective}
-TONE: {tone_desc}
-
-CONTENT REQUIREMENTS:
-- Approximately {section_words} words
-- At least 1 concrete example or numerical data
-- At least 2 practical, actionable tips
-- For bullet lists use: "• "{keyword_instruction}{secondary_instruction}
-- Use placeholders: {placeholder_hint}
+def build_section_prompt(
+    ctx: SectionPromptContext,
+    heading: str,
+    section_index: int,
+    section_words: int,
+    previous_topics: str = ""
+) -> Prompt:
+    """Build section content prompt - SEO optimized.
 
-AVOID:{avoid_topics}
-- DO NOT REPEAT MAIN TITLE: Don't use "{title}" within the section
-- Generic phrases: "quality service", "reliable platform", "professional team"
-- Exaggerated claims: "the best", "absolutely", "must", "guaranteed"
-- Filler sentences: "as everyone knows", "undoubtedly"
+    previous_topics is the already-joined list of earlier headings.
+    """
+    perspective = _get_section_perspective(section_index)
 
-IMPORTANT: Write plain text only. Do not use HTML tags.
+    avoid_block = ""
+    if previous_topics:
+        avoid_block = f"\n- DO NOT REPEAT (already covered): {previous_topics}"
 
-LANGUAGE: Write the content in {language}.'''
+    secondary_block = ""
+    if ctx.secondary_keywords:
+        heading_lower = heading.lower()
+        relevant_kw = [kw for kw, kw_lower in ctx.secondary_keywords if kw_lower in heading_lower]
+        if relevant_kw:
+            secondary_block = f"\n- Related keywords (use naturally): {', '.join(relevant_kw)}"
+
+    return Prompt(_SECTION_STATIC, _SECTION_TEMPLATE.format_map({
+        "heading": heading,
+        "title": ctx.title,
+        "section_number": section_index + 1,
+        "total_sections": ctx.total_sections,
+        "perspective": perspective,
+        "tone_desc": ctx.tone_desc,
+        "section_words": section_words,
+        "keyword_block": ctx.keyword_line,
+        "secondary_block": secondary_block,
+        "placeholder_hint": ctx.placeholder_hint,
+        "avoid_block": avoid_block,
+        "language_line": ctx.language_line,
+    }))
 
 
 def build_conclusion_prompt(
     title: str,
-    headings: list[str],
+    headings: Sequence[str],
     conclusion_words: int,
     seo: SEOConfig,
     language: str = "English"
-) -> str:
+) -> Prompt:
     """Build conclusion paragraph prompt - SEO optimized."""
-    topics = ', '.join(headings)
+    return _build_conclusion_prompt(
+        title, tuple(headings), conclusion_words, seo.primary_keyword, language
+    )
 
-    keyword_instruction = ""
-    if seo.primary_keyword:
-        keyword_instruction = f"\n- Use the primary keyword ({seo.primary_keyword}) once more"
-
-    return f'''Write a CONCLUSION paragraph for an article about "{title}".
-
-TOPICS COVERED IN THE ARTICLE: {topics}
-
-CONTENT REQUIREMENTS:
-- Approximately {conclusion_words} words
-- Summarize main points in 1-2 sentences (synthesis, not repetition)
-- Suggest a concrete next step for the reader (CTA)
-- End with a positive but realistic tone{keyword_instruction}
 
-AVOID:
-- Starting with "In conclusion"
-- Repeating exactly what was said in the article
-- Exaggerated promises
-
-IMPORTANT: Write plain text only. Do not use HTML tags.
+@lru_cache(maxsize=32)
+def _build_conclusion_prompt(
+    title: str,
+    headings: tuple[str, ...],
+    conclusion_words: int,
+    primary_keyword: str,
+    language: str
+) -> Prompt:
+    """Memoized conclusion prompt (pure function of hashable inputs)."""
+    topics = ', '.join(headings)
 
-LANGUAGE: Write the content in {language}.'''
+    keyword_block = ""
+    if primary_keyword:
+        keyword_block = f"\n- Use the primary keyword ({primary_keyword}) once more"
+
+    return Prompt(_CONCLUSION_STATIC, _CONCLUSION_TEMPLATE.format_map({
+        "title": title,
+        "topics": topics,
+        "conclusion_words": conclusion_words,
+        "keyword_block": keyword_block,
+        "language_line": _language_line(language),
+    }))
@@ -12,18 +12,23 @@ Interactive Content Generation Script v4
 import argparse
 import asyncio
 import os
-from datetime import datetime
+import sys
+import time
 from pathlib import Path
+from typing import Optional
 
 from tqdm import tqdm
 
 from api.client import OpenRouterClient
 from core import (
+    DEFAULT_CACHE_DIR,
     DEFAULT_CONFIG_PATH,
     DEFAULT_OUTPUT_DIR,
+    MAX_CONCURRENT_REQUESTS,
     ConfigNotFoundError,
     ContentConfig,
     GeneratedContent,
+    Prompt,
     load_api_key,
     load_config,
     save_default_config,
@@ -34,61 +39,72 @@ from generators.markdown import build_full_md, build_table_md
 from generators.prompts import (
     build_conclusion_prompt,
     build_intro_prompt,
+    build_section_context,
     build_section_prompt,
     build_table_prompt,
 )
-from utils.text import clean_markdown_fences, parse_table_data
+from utils.text import clean_markdown_fences, count_words, parse_table_data
 
 
 # ============================================================
 # PREVIEW MODE
 # ============================================================
 
+_PREVIEW_SECTION = """   <section>
+      <h2>{heading}</h2>
+      ~{words} words content
+   </section>
+"""
+
+
 def show_preview(config: ContentConfig) -> None:
     """Show structure without making API calls."""
-    print()
-    print("=" * 50)
-    print("   PREVIEW MODE (no API calls will be made)")
-    print("=" * 50)
-    print()
-
-    print(f"📄 STRUCTURE:")
-    print(f"   <h1>{config.title}</h1>")
-    print()
-    print(f"   <div class=\"intro\">")
-    print(f"      ~{config.intro_words} words intro paragraph")
-    print(f"   </div>")
-    print()
+    lines: list[str] = []
+    add = lines.append
+
+    add("")
+    add("=" * 50)
+    add("   PREVIEW MODE (no API calls will be made)")
+    add("=" * 50)
+    add("")
+
+    add("📄 STRUCTURE:")
+    add(f"   <h1>{config.title}</h1>")
+    add("")
+    add("   <div class=\"intro\">")
+    add(f"      ~{config.intro_words} words intro paragraph")
+    add("   </div>")
+    add("")
 
     if config.table.enabled and config.table.rows > 0:
         col_headers = [col.header for col in config.table.columns]
-        print(f"   <div class=\"comparison-table\">")
-        print(f"      <h2>Comparison</h2>")
-        print(f"      <table> {config.table.rows} rows, {len(col_headers)} columns: {', '.join(col_headers)} </table>")
-        print(f"   </div>")
-        print()
+        add("   <div class=\"comparison-table\">")
+        add("      <h2>Comparison</h2>")
+        add(f"      <table> {config.table.rows} rows, {len(col_headers)} columns: {', '.join(col_headers)} </table>")
+        add("   </div>")
+        add("")
 
     for section in config.sections:
-        print(f"   <section>")
-        print(f"      <h2>{section.heading}</h2>")
-        print(f"      ~{section.words} words content")
-        print(f"   </section>")
-        print()
-
-    print(f"   <div class=\"conclusion\">")
-    print(f"      <h2>Conclusion</h2>")
-    print(f"      ~{config.conclusion_words} words summary")
-    print(f"   </div>")
-    print()
+        add(_PREVIEW_SECTION.format(heading=section.heading, words=section.words))
 
-    print(f"📊 ESTIMATES:")
-    print(f"   Total words: ~{config.total_words}")
-    print(f"   API calls: {config.api_call_count}")
-    print(f"   Model: {config.model}")
-    print(f"   Output format: {config.output}")
-    print(f"   Language: {config.language}")
-    print(f"   Estimated cost: ~${config.api_call_count * 0.0002:.4f}")
-    print()
+    add("   <div class=\"conclusion\">")
+    add("      <h2>Conclusion</h2>")
+    add(f"      ~{config.conclusion_words} words summary")
+    add("   </div>")
+    add("")
+
+    add("📊 ESTIMATES:")
+    add(f"   Total words: ~{config.total_words}")
+    add(f"   API calls: {config.api_call_count}")
+    add(f"   Model: {config.model}")
+    add(f"   Output format: {config.output}")
+    add(f"   Language: {config.language}")
+    add(f"   Estimated cost: ~${config.api_call_count * 0.0002:.4f}")
+    add("")
+
+    # One write instead of a print() per line
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
 
 
 # ============================================================
@@ -97,54 +113,95 @@ def show_preview(config: ContentConfig) -> None:
 
 async def generate_all_content(
     api_key: str,
-    config: ContentConfig
+    config: ContentConfig,
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    batch_sections: bool = False
 ) -> GeneratedContent:
     """Generate all content in parallel."""
-    headings = config.headings
+    # Read config once into locals; headings as a tuple for the memoized builders
+    title = config.title
+    language = config.language
+    seo = config.seo
+    sections = config.sections
+    headings = tuple(config.headings)
     table_rows = config.table.rows if config.table.enabled else 0
 
-    print(f"\n   🚀 Starting {config.api_call_count} API calls in parallel...\n")
+    total_calls = config.api_call_count
+    call_count = total_calls
+    if batch_sections and len(sections) > 1:
+        call_count -= len(sections) - 1
+
+    print(f"\n   🚀 Starting {call_count} API calls in parallel...\n")
 
-    async with OpenRouterClient(api_key, config.model, config.site.url) as client:
-        with tqdm(total=config.api_call_count, desc="   Content generation", unit="section") as pbar:
-            tasks: list[tuple[str, str]] = []
+    async with OpenRouterClient(
+        api_key, config.model, config.site.url,
+        cache_dir=cache_dir, max_concurrent=max_concurrent
+    ) as client:
+        # mininterval throttles redraws so bursts of completions don't each hit the TTY
+        with tqdm(
+            total=total_calls, desc="   Content generation", unit="section", mininterval=0.5
+        ) as pbar:
+            tasks: list[tuple[str, Prompt]] = []
 
             # 1. Introduction paragraph
             intro_prompt = build_intro_prompt(
-                config.title, headings, config.intro_words, config.seo, config.language
+                title, headings, config.intro_words, seo, language
             )
             tasks.append(("intro", intro_prompt))
 
             # 2. Comparison table (optional)
             if table_rows > 0:
                 table_prompt = build_table_prompt(
-                    config.title, config.table, config.placeholders, config.language
+                    title, config.table, config.placeholders, language
                 )
                 tasks.append(("table", table_prompt))
 
-            # 3. Sections
-            for i, section in enumerate(config.sections):
+            # 3. Sections (shared fragments built once per article)
+            section_ctx = build_section_context(
+                title,
+                len(sections),
+                seo,
+                config.placeholders,
+                language
+            )
+            previous_topics = ""
+            section_prompts: list[Prompt] = []
+            for i, section in enumerate(sections):
                 section_prompt = build_section_prompt(
-                    config.title,
-                    section.heading,
-                    section.words,
-                    i,
-                    len(config.sections),
-                    headings[:i],
-                    config.seo,
-                    config.placeholders,
-                    config.language
+                    section_ctx, section.heading, i, section.words, previous_topics
+                )
+                if batch_sections:
+                    section_prompts.append(section_prompt)
+                else:
+                    tasks.append((f"section_{i}", section_prompt))
+                previous_topics = (
+                    f"{previous_topics}, {section.heading}" if previous_topics else section.heading
                 )
-                tasks.append((f"section_{i}", section_prompt))
 
             # 4. Conclusion paragraph
             conclusion_prompt = build_conclusion_prompt(
-                config.title, headings, config.conclusion_words, config.seo, config.language
+                title, headings, config.conclusion_words, seo, language
             )
             tasks.append(("conclusion", conclusion_prompt))
 
-            # Run all tasks in parallel
-            results = await client.generate_batch(tasks, pbar=pbar)
+            # Run all tasks in parallel (sections as one combined request if batched)
+            if batch_sections:
+                # TaskGroup cancels the sibling request as soon as one side fails
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        batch_task = tg.create_task(client.generate_batch(tasks, pbar=pbar))
+                        multi_task = tg.create_task(
+                            client.generate_multi(section_prompts, pbar=pbar)
+                        )
+                except ExceptionGroup as eg:
+                    raise eg.exceptions[0] from None
+                results = batch_task.result()
+                results.update(
+                    (f"section_{i}", text) for i, text in enumerate(multi_task.result())
+                )
+            else:
+                results = await client.generate_batch(tasks, pbar=pbar)
 
     # Organize results
     content = GeneratedContent()
@@ -161,7 +218,7 @@ async def generate_all_content(
     # Sections (ordered)
     content.sections = [
         results.get(f"section_{i}", "")
-        for i in range(len(config.sections))
+        for i in range(len(sections))
     ]
 
     return content
@@ -171,18 +228,20 @@ async def generate_all_content(
 # FILE SAVING
 # ============================================================
 
-def save_output(content: str, output_dir: str, output_format: str = "html") -> str:
-    """Save content to file."""
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M")
+async def save_output(content: str, output_dir: str, output_format: str = "html") -> str:
+    """Save content to file without blocking the event loop."""
+    out_dir = Path(output_dir)
     extension = "md" if output_format == "md" else "html"
-    filename = f"{timestamp}.{extension}"
-    filepath = os.path.join(output_dir, filename)
+    filepath = out_dir / f"{time.strftime('%Y-%m-%d-%H-%M')}.{extension}"
+    data = content.encode("utf-8")
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+    def _write() -> None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        filepath.write_bytes(data)
 
-    return filepath
+    await asyncio.to_thread(_write)
+
+    return str(filepath)
 
 
 # ============================================================
@@ -223,7 +282,10 @@ async def run_async(args: argparse.Namespace) -> None:
     print("-" * 50)
 
     # Parallel generation
-    content = await generate_all_content(api_key, config)
+    cache_dir = None if args.no_cache else DEFAULT_CACHE_DIR
+    content = await generate_all_content(
+        api_key, config, args.max_concurrency, cache_dir, args.batch_sections
+    )
 
     # Build output based on format
     table_header = get_translation(config.language, "comparison")
@@ -242,10 +304,10 @@ async def run_async(args: argparse.Namespace) -> None:
 
     # Save
     output_dir = os.path.join(script_dir, DEFAULT_OUTPUT_DIR)
-    filepath = save_output(full_content, output_dir, config.output)
+    filepath = await save_output(full_content, output_dir, config.output)
 
     # Calculate word count
-    word_count = len(full_content.split())
+    word_count = count_words(full_content)
 
     print()
     print("=" * 50)
@@ -256,21 +318,57 @@ async def run_async(args: argparse.Namespace) -> None:
     print("=" * 50)
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     """Parse arguments."""
     parser = argparse.ArgumentParser(description="SEO Content Generator v4")
     parser.add_argument("-c", "--config", help="YAML config file path")
     parser.add_argument("-p", "--preview", action="store_true", help="Preview mode")
     parser.add_argument("--init", action="store_true", help="Create example config")
+    parser.add_argument(
+        "--max-concurrency", type=_positive_int, default=MAX_CONCURRENT_REQUESTS,
+        help=f"Maximum parallel API requests (default: {MAX_CONCURRENT_REQUESTS})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Ignore cached responses in {DEFAULT_CACHE_DIR} and always call the API"
+    )
+    parser.add_argument(
+        "--batch-sections", action="store_true",
+        help="Generate all sections in a single API request"
+    )
     return parser.parse_args()
 
 
+def _run(coro) -> None:
+    """Run the coroutine on uvloop when it is installed, else on the default loop."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(coro)
+            return
+    asyncio.run(coro)
+
+
 def main():
     """Entry point."""
     args = parse_args()
 
     try:
-        asyncio.run(run_async(args))
+        _run(run_async(args))
     except KeyboardInterrupt:
         print("\n\n⚠️ Operation cancelled.")
     except Exception as e:
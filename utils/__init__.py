@@ -1,4 +1,14 @@
 """Utility functions."""
-from utils.text import clean_markdown_fences, parse_table_data, truncate_to_char_limit
+from utils.text import (
+    clean_markdown_fences,
+    count_words,
+    parse_table_data,
+    truncate_to_char_limit,
+)
 
-__all__ = ["clean_markdown_fences", "parse_table_data", "truncate_to_char_limit"]
+__all__ = [
+    "clean_markdown_fences",
+    "count_words",
+    "parse_table_data",
+    "truncate_to_char_limit",
+]
@@ -1,26 +1,29 @@
 """Text processing helper functions."""
-from core.constants import MARKDOWN_FENCE_PATTERN
+from core.constants import LAST_SENTENCE_END_PATTERN, MARKDOWN_FENCE_PATTERN, WORD_PATTERN
 from core.models import TableColumn, TableRow
 
 
 def clean_markdown_fences(text: str) -> str:
     """Clean markdown code fences (```html, ``` etc.)."""
+    if '```' not in text:
+        return text.strip()
     return MARKDOWN_FENCE_PATTERN.sub('', text).strip()
 
 
 def parse_table_data(raw_data: str, columns: list[TableColumn]) -> list[TableRow]:
     """Parse pipe-separated table data dynamically."""
+    ncols = len(columns)
+    index = {col.name: i for i, col in enumerate(columns)}
     rows = []
+    append = rows.append
     for line in raw_data.strip().split('\n'):
-        line = line.strip()
-        if not line or '|' not in line:
+        if '|' not in line:
             continue
-        parts = [p.strip() for p in line.split('|')]
-        if len(parts) >= len(columns):
-            values = {}
-            for i, col in enumerate(columns):
-                values[col.name] = parts[i] if i < len(parts) else ""
-            rows.append(TableRow(values=values))
+        # Extra trailing columns stay unsplit in the last part and are dropped
+        parts = line.split('|', ncols)
+        if len(parts) < ncols:
+            continue
+        append(TableRow(values=tuple(map(str.strip, parts[:ncols])), index=index))
     return rows
 
 
@@ -33,13 +36,15 @@ def truncate_to_char_limit(content: str, max_chars: int) -> tuple[str, bool]:
         return content, False
 
     truncated = content[:max_chars]
-    last_sentence_end = max(
-        truncated.rfind('.'),
-        truncated.rfind('!'),
-        truncated.rfind('?')
-    )
+    match = LAST_SENTENCE_END_PATTERN.match(truncated)
+    last_sentence_end = match.end() - 1 if match else -1
 
     if last_sentence_end > max_chars * 0.7:
         return truncated[:last_sentence_end + 1], True
 
     return truncated, True
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words without materializing a word list."""
+    return sum(1 for _ in WORD_PATTERN.finditer(text))